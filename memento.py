@@ -1,36 +1,58 @@
 #!/usr/bin/env python3
+"""Memento: a terminal vocabulary trainer.
 
+Performance note: the work here is terminal output, short string formatting
+and small JSON files. Speed comes from buffered single writes, cached renders
+and session state, bisect lookups and orjson. A JIT (Numba, PyPy) is
+deliberately not used: it cannot compile this string-heavy code, and its
+import and compile time would outlast a typical session.
+"""
+
+import atexit
+import bisect
 import json
 import time
 import os
 import random
 import sys
 import csv
+import functools
+import mmap
+from collections import deque
 from datetime import datetime
 import shutil
+import signal
+
+# Prefer orjson for persistence; both helpers work on UTF-8 encoded bytes
+# (_loads also accepts any buffer, e.g. a memoryview over an mmap)
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    def _loads(data):
+        return json.loads(bytes(data))
 
 CURRENT_DISPLAY = "main"
 
+# Sentinel for dict lookups where None could be a stored value
+_MISSING = object()
+
 def clear_screen():
     """Clear the terminal screen"""
-    os.system('clear' if os.name == 'posix' else 'cls')
-
-def get_terminal_size():
-    """Get current terminal size"""
-    return shutil.get_terminal_size()
+    if os.name == 'posix':
+        # Same sequence `clear` emits (home, clear screen, clear scrollback), without the fork/exec
+        sys.stdout.write("\x1b[H\x1b[2J\x1b[3J")
+        sys.stdout.flush()
+    else:
+        os.system('cls')
 
 def display_main_menu():
     """Display the main menu options"""
-    options = [
-        "Add Word",
-        "View Words",
-        "Quiz Yourself",
-        "Delete Word",
-        "Export Word List to CSV",
-        "Import Word List from CSV",
-        "View Statistics",
-        "Exit"
-    ]
+    sys.stdout.write(_MENU_BODY)
 
 # Color constants
 class Colors:
@@ -51,13 +73,41 @@ class Colors:
     @staticmethod
     def colorize(text, color, bold=False, underline=False):
         """Utility method to apply color and style to text"""
-        style = ""
-        if bold:
-            style += Colors.BOLD
-        if underline:
-            style += Colors.UNDERLINE
-        return f"{style}{color}{text}{Colors.RESET}"
-
+        return _colorize_template(color, bold, underline) % (text,)
+
+
+@functools.lru_cache(maxsize=64)
+def _colorize_template(color, bold, underline):
+    """Build (once per color/style combination) the '%s' template used by Colors.colorize"""
+    style = ""
+    if bold:
+        style += Colors.BOLD
+    if underline:
+        style += Colors.UNDERLINE
+    return f"{style}{color}%s{Colors.RESET}"
+
+
+def _c(text, color):
+    """Fast path of Colors.colorize for plain colored text (no bold/underline)"""
+    return f"{color}{text}{Colors.RESET}"
+
+
+# Main menu entries, rendered once since they never change
+MENU_OPTIONS = (
+    "Add Word",
+    "View Words",
+    "Quiz Yourself",
+    "Delete Word",
+    "Export Word List to CSV",
+    "Import Word List from CSV",
+    "View Statistics",
+    "Exit"
+)
+_MENU_BODY = "\n".join(
+    Colors.colorize(f"    {i}. {option}", Colors.CYAN) for i, option in enumerate(MENU_OPTIONS, 1)
+) + "\n"
+_CHOOSE_PROMPT = Colors.colorize("\n    Choose an option: ", Colors.YELLOW)
+_CONTINUE_PROMPT = Colors.colorize("\n    Press Enter to continue...", Colors.YELLOW)
 
 # The ASCII art to display
 ascii_art = [
@@ -73,6 +123,11 @@ ascii_art = [
     "                 { }      "
 ]
 
+# Rendered, padded ASCII art blocks keyed by (terminal width, art lines)
+_ART_CACHE = {}
+# Rendered menu headers keyed by (terminal width, header text)
+_HEADER_CACHE = {}
+
 def get_terminal_width():
     try:
         # Get the terminal size
@@ -82,76 +137,148 @@ def get_terminal_width():
         return 50
 
 
-def type_out_text(text_lines, delay=0.005):
-    """Display ASCII art with optional animation delay"""
-    terminal_width = get_terminal_size().columns
+# Cached terminal width, refreshed by handle_resize instead of queried on every print
+_TERM_WIDTH = get_terminal_width()
 
-    # Calculate the maximum line width in the ASCII art
+
+def handle_resize(signum, frame):
+    """Refresh the cached terminal width after the terminal is resized"""
+    global _TERM_WIDTH
+    terminal_width = get_terminal_width()
+    if terminal_width != _TERM_WIDTH:
+        _TERM_WIDTH = terminal_width
+        # Renders for the old width will not be needed again
+        _ART_CACHE.clear()
+        _HEADER_CACHE.clear()
+
+
+# SIGWINCH only exists on POSIX; elsewhere the width is refreshed from the main menu loop
+_HAS_SIGWINCH = hasattr(signal, "SIGWINCH")
+if _HAS_SIGWINCH:
+    signal.signal(signal.SIGWINCH, handle_resize)
+
+
+def _art_padding(text_lines, terminal_width):
+    """Left padding that centers the ASCII art in the given width"""
     max_line_width = max(len(line) for line in text_lines)
+    return " " * max(0, (terminal_width - max_line_width) // 2)
 
-    # Calculate left padding to center the art
-    left_padding = (terminal_width - max_line_width) // 2
-    left_padding = max(0, left_padding)  # Ensure padding is not negative
 
+def _render_art(text_lines, terminal_width):
+    """Build the colored ASCII art block centered for the given width"""
+    pad = _art_padding(text_lines, terminal_width)
+    return Colors.CYAN + "\n".join(pad + line for line in text_lines) + "\n" + Colors.RESET
+
+
+def type_out_text(text_lines, delay=0.005):
+    """Display ASCII art with optional animation delay"""
+    terminal_width = _TERM_WIDTH
+
+    if delay <= 0:
+        cache_key = (terminal_width, tuple(text_lines))
+        rendered = _ART_CACHE.get(cache_key)
+        if rendered is None:
+            rendered = _render_art(text_lines, terminal_width)
+            _ART_CACHE[cache_key] = rendered
+        # No animation: emit the whole block with a single write
+        sys.stdout.write(rendered)
+        sys.stdout.flush()
+        return
+
+    pad = _art_padding(text_lines, terminal_width)
+
+    # Animate line by line: one write, flush and sleep per line rather than per character
     sys.stdout.write(Colors.CYAN)
     for line in text_lines:
-        # Print padding first
-        sys.stdout.write(" " * left_padding)
-        # Then print each character in the line
-        if delay > 0:
-            for char in line:
-                sys.stdout.write(char)
-                sys.stdout.flush()
-                time.sleep(delay)
-            sys.stdout.write("\n")
-        else:
-            # If delay is 0, print the whole line at once
-            sys.stdout.write(line + "\n")
+        sys.stdout.write(pad + line + "\n")
+        sys.stdout.flush()
+        time.sleep(delay)
     sys.stdout.write(Colors.RESET)
     sys.stdout.flush()
 
 def load_words():
     try:
-        with open("data/words.json", "r") as f:
-            return json.load(f)
+        with open("data/words.json", "rb") as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size == 0:
+                return {}
+            # Parse straight from the mapped pages instead of copying the file into a buffer
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return _loads(view)
     except FileNotFoundError:
         return {}
 
 
+# Number of recent quiz results kept in stats.json; averages use running totals
+MAX_QUIZ_RESULTS = 100
+
+# Stats dict shared by the whole session, populated on the first get_stats() call
+_STATS_CACHE = None
+
+
 def load_stats():
     try:
-        with open("data/stats.json", "r") as f:
-            return json.load(f)
+        with open("data/stats.json", "rb") as f:
+            stats = _loads(f.read())
     except FileNotFoundError:
-        return {
+        stats = {
             "total_quizzes": 0,
             "words_learned": 0,
             "quiz_results": [],
-            "last_quiz_date": None
+            "last_quiz_date": None,
+            "sum_percentage": 0.0,
+            "first_percentage": None
         }
 
+    # Stats saved before running totals were tracked: derive them once from the history
+    if "sum_percentage" not in stats:
+        results = stats["quiz_results"]
+        stats["sum_percentage"] = sum(result["percentage"] for result in results)
+        stats["first_percentage"] = results[0]["percentage"] if results else None
+
+    # Bounded history: appending past the limit drops the oldest result
+    stats["quiz_results"] = deque(stats["quiz_results"], maxlen=MAX_QUIZ_RESULTS)
+    return stats
+
+
+def get_stats():
+    """Return the session's stats, reading stats.json only on first use"""
+    global _STATS_CACHE
+    if _STATS_CACHE is None:
+        _STATS_CACHE = load_stats()
+    return _STATS_CACHE
+
+
+def _write_json(path, obj):
+    """Serialize obj to a temp file and move it over path, so a crash never leaves a torn file"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_dumps(obj))
+    os.replace(tmp_path, path)
+
 
 def save_words(words):
     os.makedirs("data", exist_ok=True)
-    with open("data/words.json", "w") as f:
-        json.dump(words, f)
+    _write_json("data/words.json", words)
 
 
 def save_stats(stats):
     os.makedirs("data", exist_ok=True)
-    with open("data/stats.json", "w") as f:
-        json.dump(stats, f)
+    _write_json("data/stats.json", {**stats, "quiz_results": list(stats["quiz_results"])})
 
 
 def print_menu_header(text):
     """Print a stylized header for menus and sections"""
     try:
-        terminal_width, _ = get_terminal_size()
-        separator = "═" * (terminal_width - 4)
-
-        print(f"\n{Colors.colorize(separator.center(terminal_width), Colors.BLUE)}")
-        print(Colors.colorize(text.center(terminal_width), Colors.YELLOW, bold=True))
-        print(Colors.colorize(separator.center(terminal_width), Colors.BLUE))
+        terminal_width = _TERM_WIDTH
+        cache_key = (terminal_width, text)
+        header = _HEADER_CACHE.get(cache_key)
+        if header is None:
+            separator = Colors.colorize(("═" * (terminal_width - 4)).center(terminal_width), Colors.BLUE)
+            title = Colors.colorize(text.center(terminal_width), Colors.YELLOW, bold=True)
+            header = f"\n{separator}\n{title}\n{separator}\n"
+            _HEADER_CACHE[cache_key] = header
+        sys.stdout.write(header)
     except:
         # Fallback: simple header if centering fails
         print(f"\n{Colors.BLUE}{'═' * 50}{Colors.RESET}")
@@ -161,11 +288,10 @@ def print_menu_header(text):
 def center_text(text, width=None):
     """Center align any text based on terminal width"""
     if width is None:
-        width = shutil.get_terminal_size().columns
+        width = _TERM_WIDTH
     return text.center(width)
 
-def update_stats(correct_count, total_words, words_attempted):
-    stats = load_stats()
+def update_stats(stats, correct_count, total_words, words_attempted):
     stats["total_quizzes"] += 1
     stats["words_learned"] = max(stats["words_learned"], correct_count)
 
@@ -176,15 +302,15 @@ def update_stats(correct_count, total_words, words_attempted):
         "percentage": (correct_count / total_words) * 100 if total_words > 0 else 0,
         "words_attempted": words_attempted
     }
+    stats["sum_percentage"] += quiz_result["percentage"]
+    if stats["first_percentage"] is None:
+        stats["first_percentage"] = quiz_result["percentage"]
+
     stats["quiz_results"].append(quiz_result)
     stats["last_quiz_date"] = quiz_result["date"]
 
-    save_stats(stats)
-
-
-def view_stats():
-    stats = load_stats()
 
+def view_stats(stats):
     if stats["total_quizzes"] == 0:
         print(Colors.colorize("\nNo quiz statistics available yet. Take a quiz first!", Colors.YELLOW))
         return
@@ -194,23 +320,21 @@ def view_stats():
     print(Colors.colorize(f"Total quizzes taken: {stats['total_quizzes']}", Colors.CYAN))
     print(Colors.colorize(f"Words learned: {stats['words_learned']}", Colors.CYAN))
 
-    if stats["quiz_results"]:
-        total_percentage = sum(result["percentage"] for result in stats["quiz_results"])
-        avg_percentage = total_percentage / len(stats["quiz_results"])
-        print(Colors.colorize(f"Average score: {avg_percentage:.1f}%", Colors.MAGENTA))
+    avg_percentage = stats["sum_percentage"] / stats["total_quizzes"]
+    print(Colors.colorize(f"Average score: {avg_percentage:.1f}%", Colors.MAGENTA))
 
     if stats["last_quiz_date"]:
         print(Colors.colorize(f"Last quiz taken: {stats['last_quiz_date']}", Colors.BLUE))
 
-    if len(stats["quiz_results"]) >= 2:
-        first_quiz = stats["quiz_results"][0]["percentage"]
+    if stats["total_quizzes"] >= 2 and stats["quiz_results"]:
+        first_quiz = stats["first_percentage"]
         last_quiz = stats["quiz_results"][-1]["percentage"]
         improvement = last_quiz - first_quiz
         color = Colors.GREEN if improvement >= 0 else Colors.RED
         print(Colors.colorize(f"Improvement since first quiz: {improvement:+.1f}%", color))
 
     print(Colors.colorize("\nRecent quiz results:", Colors.YELLOW, bold=True))
-    for result in stats["quiz_results"][-5:]:
+    for result in list(stats["quiz_results"])[-5:]:
         percentage = result['percentage']
         if percentage >= 80:
             color = Colors.GREEN
@@ -226,12 +350,16 @@ def view_stats():
 
 def add_word(words):
     print_menu_header("Add New Words")
+    changed = False
     while True:
         word = input(Colors.colorize("Enter the word (or type 'main' to return to the main menu): ", Colors.CYAN))
         if word.lower() == 'main':
             break
         definition = input(Colors.colorize(f"Enter the definition for '{word}': ", Colors.CYAN))
-        words[word] = definition
+        # Skip the insert (and the save) when the word already has this definition
+        if words.get(word, _MISSING) != definition:
+            words[word] = definition
+            changed = True
         print(Colors.colorize(f"'{word}' added successfully!", Colors.GREEN))
         continue_adding = input(Colors.colorize(
             "Do you want to add another word? (yes to continue, 'main' to return to the menu): ",
@@ -239,7 +367,30 @@ def add_word(words):
         ))
         if continue_adding.lower() == 'main':
             break
-    save_words(words)
+    if changed:
+        save_words(words)
+
+
+def _build_prefix_index(words):
+    """Sorted (lowercase word, original position, word) tuples for bisect prefix lookups"""
+    return sorted((word.lower(), position, word) for position, word in enumerate(words))
+
+
+def _prefix_matches(index, prefix):
+    """Return the words whose lowercase form starts with prefix, in their original order"""
+    matches = []
+    for j in range(bisect.bisect_left(index, (prefix,)), len(index)):
+        key, position, word = index[j]
+        if not key.startswith(prefix):
+            break
+        matches.append((position, word))
+    matches.sort()
+    return [word for _, word in matches]
+
+
+def _filter_words(words, index, prefix):
+    """Return the words matching a lowercase filter prefix; an empty filter matches everything"""
+    return _prefix_matches(index, prefix) if prefix else words
 
 
 def view_words(words):
@@ -248,46 +399,46 @@ def view_words(words):
         print(Colors.colorize("    No words available.", Colors.YELLOW))
         return
 
-    terminal_width = shutil.get_terminal_size().columns
     current_filter = ""
+    prefix_index = _build_prefix_index(words)
+    matches = words
 
     while True:
         # Clear screen for each update
         clear_screen()
         print_menu_header("Word List")
 
+        # Collect the whole screen body and emit it with a single write
+        terminal_width = _TERM_WIDTH
+        buf = []
+
         # Show current filter if any
         if current_filter:
-            print(Colors.colorize(f"\n    Current filter: {current_filter}", Colors.YELLOW))
+            buf.append(_c(f"\n    Current filter: {current_filter}", Colors.YELLOW))
 
-        # Filter and display words
-        filtered_words = {
-            word: definition
-            for word, definition in words.items()
-            if word.lower().startswith(current_filter.lower())
-        }
+        # Format the words matching the current filter
+        for i, word in enumerate(matches, 1):
+            definition = words[word]
+            entry = f"    {i}. {word}: {definition}"
 
-        # Display filtered words
-        if filtered_words:
-            for i, (word, definition) in enumerate(filtered_words.items(), 1):
-                entry = f"    {i}. {word}: {definition}"
+            if len(entry) > terminal_width:
+                available_width = terminal_width - (len(f"    {i}. {word}: "))
+                wrapped_definition = definition[:available_width - 3] + "..."
+                entry = f"    {i}. {word}: {wrapped_definition}"
 
-                if len(entry) > terminal_width:
-                    available_width = terminal_width - (len(f"    {i}. {word}: "))
-                    wrapped_definition = definition[:available_width - 3] + "..."
-                    entry = f"    {i}. {word}: {wrapped_definition}"
+            buf.append(_c(entry, Colors.GREEN))
 
-                print(Colors.colorize(entry, Colors.GREEN))
-        else:
-            print(Colors.colorize(f"\n    No words found starting with '{current_filter}'", Colors.YELLOW))
+        if not matches:
+            buf.append(_c(f"\n    No words found starting with '{current_filter}'", Colors.YELLOW))
 
         # Show instructions
-        print(Colors.colorize(
+        buf.append(_c(
             "\n    Type a letter to filter words, press Enter to return to menu, or type 'clear' to clear filter",
             Colors.CYAN))
+        sys.stdout.write("\n".join(buf) + "\n")
 
         # Get user input
-        user_input = input(Colors.colorize("\n    Input: ", Colors.YELLOW)).lower()
+        user_input = input(_c("\n    Input: ", Colors.YELLOW)).lower()
 
         # Handle user input
         if user_input == '':
@@ -297,11 +448,15 @@ def view_words(words):
         else:
             current_filter += user_input  # Add to current filter
 
+        # Look up the new filter once; the next redraw reuses the result
+        matches = _filter_words(words, prefix_index, current_filter.lower())
+
         # If no words match the filter, give option to remove last character
-        if not any(word.lower().startswith(current_filter.lower()) for word in words):
-            print(Colors.colorize("\n    No matches found! Last character will be removed.", Colors.RED))
+        if not matches:
+            print(_c("\n    No matches found! Last character will be removed.", Colors.RED))
             time.sleep(1)
             current_filter = current_filter[:-1]  # Remove last character
+            matches = _filter_words(words, prefix_index, current_filter.lower())
 
 def delete_word(words):
     print_menu_header("Delete Word")
@@ -310,59 +465,104 @@ def delete_word(words):
         return
 
     word_to_delete = input(Colors.colorize("Enter the word you want to delete: ", Colors.CYAN))
-    if word_to_delete in words:
-        del words[word_to_delete]
+    if words.pop(word_to_delete, _MISSING) is _MISSING:
+        print(Colors.colorize(f"'{word_to_delete}' not found in the list.", Colors.RED))
+    else:
         print(Colors.colorize(f"'{word_to_delete}' has been deleted.", Colors.GREEN))
         save_words(words)
-    else:
-        print(Colors.colorize(f"'{word_to_delete}' not found in the list.", Colors.RED))
+
+
+# Progress bar of 50 cells: the first 17 are red, the next 16 yellow, the rest green
+_BAR_LENGTH = 50
+_RED_CELLS = 17
+_YELLOW_CELLS = 16
+
+
+def _stdout_encoding():
+    return getattr(sys.stdout, "encoding", None) or "utf-8"
+
+
+def _write_bytes(data):
+    """Write pre-encoded output to the binary stdout, skipping the text layer's encoder"""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # stdout replaced by a text-only stream
+        sys.stdout.write(data.decode(_stdout_encoding()))
+        return
+    # Flush pending text first so output stays in order
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+@functools.lru_cache(maxsize=None)
+def _progress_bar(filled_length, encoding):
+    """Render the encoded bar for a fill level; there are only _BAR_LENGTH + 1 distinct bars"""
+    # Create a multicolored progress bar from contiguous runs, one escape sequence per run
+    red = min(filled_length, _RED_CELLS)
+    yellow = min(max(filled_length - _RED_CELLS, 0), _YELLOW_CELLS)
+    green = max(filled_length - _RED_CELLS - _YELLOW_CELLS, 0)
+    runs = (
+        (Colors.RED, "█", red),
+        (Colors.YELLOW, "█", yellow),
+        (Colors.GREEN, "█", green),
+        (Colors.WHITE, "─", _BAR_LENGTH - filled_length),
+    )
+    bar = "".join(color + cell * count for color, cell, count in runs if count)
+    return f"\n[{bar}{Colors.RESET}] ".encode(encoding)
 
 
 def print_progress(current, total):
     progress = (current / total) * 100
-    bar_length = 50
     filled_length = int(progress // 2)
-
-    # Create a multicolored progress bar
-    bar = ""
-    for i in range(bar_length):
-        if i < filled_length:
-            if i < bar_length * 0.33:  # First third is red
-                bar += Colors.RED + "█"
-            elif i < bar_length * 0.66:  # Middle third is yellow
-                bar += Colors.YELLOW + "█"
-            else:  # Last third is green
-                bar += Colors.GREEN + "█"
-        else:
-            bar += Colors.WHITE + "─"
+    encoding = _stdout_encoding()
 
     words_done = current
     words_left = total - current
-    print(f"\n[{bar}{Colors.RESET}] {Colors.CYAN}{progress:.1f}%{Colors.RESET}")
-    print(Colors.colorize(f"Progress: {words_done}/{total} words done, {words_left} left", Colors.BLUE))
-    sys.stdout.flush()
+    status = (
+        f"{Colors.CYAN}{progress:.1f}%{Colors.RESET}\n"
+        + _c(f"Progress: {words_done}/{total} words done, {words_left} left", Colors.BLUE)
+        + "\n"
+    )
+    _write_bytes(_progress_bar(filled_length, encoding) + status.encode(encoding))
+
+
+def _lower_per_char(text):
+    """Lowercase text so that position i still corresponds to text[i]"""
+    if text.isascii():
+        return text.lower()
+    # Non-ASCII lower() can change the length ('İ') or depend on context (final 'Σ')
+    return [char.lower() for char in text]
 
 
 def highlight_mistakes(user_answer, correct_word):
-    result = ""
-    for i, char in enumerate(user_answer):
-        if i < len(correct_word):
-            # Convert both to lowercase for comparison
-            if char.lower() == correct_word[i].lower():
-                # If it matches, keep the original case
-                result += Colors.colorize(char, Colors.GREEN)
-            else:
-                # If it doesn't match, make it uppercase
-                result += Colors.colorize(char.upper(), Colors.RED, bold=True)
+    green_on = Colors.GREEN
+    red_bold_on = Colors.BOLD + Colors.RED
+    reset = Colors.RESET
+
+    # Compare case-insensitively, lowering each string once up front
+    answer_lower = _lower_per_char(user_answer)
+    correct_lower = _lower_per_char(correct_word)
+
+    parts = []
+    # zip stops at the shorter string, pairing each typed character with the expected one
+    for char, char_lower, expected in zip(user_answer, answer_lower, correct_lower):
+        if char_lower == expected:
+            # If it matches, keep the original case
+            parts.append(f"{green_on}{char}{reset}")
         else:
-            # If the user's answer is longer than the correct word,
-            # make the extra characters uppercase
-            result += Colors.colorize(char.upper(), Colors.RED, bold=True)
+            # If it doesn't match, make it uppercase
+            parts.append(f"{red_bold_on}{char.upper()}{reset}")
 
-    return result
+    # If the user's answer is longer than the correct word,
+    # make the extra characters uppercase
+    for char in user_answer[len(correct_word):]:
+        parts.append(f"{red_bold_on}{char.upper()}{reset}")
 
+    return "".join(parts)
 
-def quiz(words, retry_mode=False, retry_words=None):
+
+def quiz(words, stats, retry_mode=False, retry_words=None):
     """
     Quiz function that handles both normal quiz mode and retry mode.
     Allows users to exit to main menu at any time by typing 'exit' or 'menu'.
@@ -403,11 +603,10 @@ def quiz(words, retry_mode=False, retry_words=None):
             except ValueError:
                 print(Colors.colorize("Invalid input. Please enter a number.", Colors.RED))
 
-        word_definitions = list(words.items())
         # Make sure quiz_size doesn't exceed the number of available words
-        quiz_size = min(quiz_size, len(word_definitions))
-        random.shuffle(word_definitions)
-        word_definitions = word_definitions[:quiz_size]
+        quiz_size = min(quiz_size, len(words))
+        # Sample from the keys only, so no (word, definition) tuple is built for unpicked words
+        word_definitions = [(word, words[word]) for word in random.sample(list(words), quiz_size)]
 
     incorrect_words = []
     total_words = quiz_size
@@ -418,14 +617,14 @@ def quiz(words, retry_mode=False, retry_words=None):
 
     for index, (word, definition) in enumerate(word_definitions, 1):
         print_progress(index - 1, total_words)
-        print(Colors.colorize(f"\nDefinition: '{definition}'", Colors.CYAN))
-        answer = input(Colors.colorize("Your answer (or type 'exit'/'menu' to end quiz): ", Colors.YELLOW))
+        print(_c(f"\nDefinition: '{definition}'", Colors.CYAN))
+        answer = input(_c("Your answer (or type 'exit'/'menu' to end quiz): ", Colors.YELLOW))
 
         # Check for exit command
         if answer.strip().lower() in ['exit', 'menu']:
             print(Colors.colorize("\nEnding quiz early. Returning to main menu...", Colors.YELLOW))
             if words_attempted:  # Only update stats if at least one word was attempted
-                update_stats(correct_count, len(words_attempted), list(words_attempted))
+                update_stats(stats, correct_count, len(words_attempted), list(words_attempted))
             return
 
         words_attempted.add(word)
@@ -436,7 +635,7 @@ def quiz(words, retry_mode=False, retry_words=None):
         else:
             print(Colors.colorize("✗ Incorrect.", Colors.RED, bold=True))
             print(f"Your answer: {highlight_mistakes(answer, word)}")
-            print(Colors.colorize(f"Correct word: '{word}'", Colors.GREEN))
+            print(_c(f"Correct word: '{word}'", Colors.GREEN))
             incorrect_words.append((word, definition))
 
     print_progress(total_words, total_words)
@@ -455,7 +654,7 @@ def quiz(words, retry_mode=False, retry_words=None):
         print(Colors.colorize("═" * 50, Colors.BLUE))
 
         if not retry_mode:
-            update_stats(correct_count, len(words_attempted), list(words_attempted))
+            update_stats(stats, correct_count, len(words_attempted), list(words_attempted))
 
         if incorrect_words:
             retry = input(Colors.colorize(
@@ -464,7 +663,11 @@ def quiz(words, retry_mode=False, retry_words=None):
             if retry.lower() == 'yes':
                 print(Colors.colorize("\nStarting retry quiz...", Colors.CYAN))
                 random.shuffle(incorrect_words)
-                quiz(words, retry_mode=True, retry_words=incorrect_words)
+                quiz(words, stats, retry_mode=True, retry_words=incorrect_words)
+
+# Buffer size for CSV import/export, so large word lists move in a few big I/O calls
+_CSV_BUFFER_SIZE = 1 << 20
+
 
 def export_words_to_csv(words):
     """Export the current word list to a CSV file."""
@@ -478,18 +681,17 @@ def export_words_to_csv(words):
     file_path = os.path.join("data", filename)
 
     try:
-        with open(file_path, "w", newline="") as csvfile:
+        with open(file_path, "w", newline="", buffering=_CSV_BUFFER_SIZE) as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(["Word", "Definition"])
-            for word, definition in words.items():
-                writer.writerow([word, definition])
+            writer.writerows(words.items())
 
         print(Colors.colorize(f"Word list exported to {file_path}", Colors.GREEN))
     except IOError:
         print(Colors.colorize(f"Error writing to {file_path}", Colors.RED))
 
 
-def import_words_from_csv():
+def import_words_from_csv(words):
     """Import a word list from a CSV file."""
     print_menu_header("Import Word List from CSV")
 
@@ -500,27 +702,33 @@ def import_words_from_csv():
         filename = input(Colors.colorize("Enter the filename (including .csv extension): ", Colors.CYAN))
         file_path = os.path.join("data", filename)
 
-        # Load existing words first
-        words = load_words()
         initial_word_count = len(words)
 
-        with open(file_path, "r", encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
+        with open(file_path, "r", encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as csvfile:
+            # Plain csv.reader with column positions avoids building a dict per row
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
 
             # Check if the CSV has the correct headers
-            if not {'Word', 'Definition'} <= set(reader.fieldnames):
+            if not {'Word', 'Definition'} <= set(header):
                 print(Colors.colorize("Error: CSV must have 'Word' and 'Definition' columns.", Colors.RED))
                 return
 
-            imported_count = 0
-            for row in reader:
-                word = row['Word'].strip()
-                definition = row['Definition'].strip()
+            word_index = header.index('Word')
+            definition_index = header.index('Definition')
+            min_row_length = max(word_index, definition_index) + 1
+
+            # Skip blank lines and rows missing either column
+            rows = (
+                (row[word_index].strip(), row[definition_index].strip())
+                for row in reader
+                if len(row) >= min_row_length
+            )
+            # Only add if both word and definition are non-empty
+            pairs = [(word, definition) for word, definition in rows if word and definition]
 
-                # Only add if both word and definition are non-empty
-                if word and definition:
-                    words[word] = definition
-                    imported_count += 1
+        imported_count = len(pairs)
+        words.update(pairs)
 
         # Save the updated words dictionary
         save_words(words)
@@ -544,31 +752,21 @@ def import_words_from_csv():
         print(Colors.colorize(f"An unexpected error occurred: {str(e)}", Colors.RED))
 
 def main():
-    env = os.environ.copy()
-    env['TERM'] = 'xterm'
-
     clear_screen()
     type_out_text(ascii_art)
     words = load_words()
+    stats = get_stats()
+    # Persist stats however the session ends (exit option, Ctrl+C or an unexpected error)
+    atexit.register(save_stats, stats)
 
     while True:
         try:
+            if not _HAS_SIGWINCH:
+                handle_resize(None, None)
             print_menu_header("MEMENTO")
-            options = [
-                "Add Word",
-                "View Words",
-                "Quiz Yourself",
-                "Delete Word",
-                "Export Word List to CSV",
-                "Import Word List from CSV",
-                "View Statistics",
-                "Exit"
-            ]
-
-            for i, option in enumerate(options, 1):
-                print(Colors.colorize(f"    {i}. {option}", Colors.CYAN))
-
-            choice = input(Colors.colorize("\n    Choose an option: ", Colors.YELLOW))
+            display_main_menu()
+
+            choice = input(_CHOOSE_PROMPT)
 
             clear_screen()
 
@@ -577,25 +775,26 @@ def main():
                 clear_screen()
             elif choice == "2":
                 view_words(words)
-                input(Colors.colorize("\n    Press Enter to continue...", Colors.YELLOW))
+                input(_CONTINUE_PROMPT)
                 clear_screen()
             elif choice == "3":
-                quiz(words)
+                quiz(words, stats)
+                save_stats(stats)
                 clear_screen()
             elif choice == "4":
                 delete_word(words)
                 clear_screen()
             elif choice == "5":
                 export_words_to_csv(words)
-                input(Colors.colorize("\n    Press Enter to continue...", Colors.YELLOW))
+                input(_CONTINUE_PROMPT)
                 clear_screen()
             elif choice == "6":
-                import_words_from_csv()
-                input(Colors.colorize("\n    Press Enter to continue...", Colors.YELLOW))
+                import_words_from_csv(words)
+                input(_CONTINUE_PROMPT)
                 clear_screen()
             elif choice == "7":
-                view_stats()
-                input(Colors.colorize("\n    Press Enter to continue...", Colors.YELLOW))
+                view_stats(stats)
+                input(_CONTINUE_PROMPT)
                 clear_screen()
             elif choice == "8":
                 print(Colors.colorize("\n    Thank you for using the Vocabulary Trainer! Goodbye!", Colors.GREEN))